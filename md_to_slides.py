@@ -6,14 +6,93 @@ Cores personalizadas: preto e #0097a7 (azul-esverdeado)
 
 import os
 import re
-import fire
-from pptx import Presentation
-from pptx.util import Inches, Pt
-from pptx.dml.color import RGBColor
-from pptx.enum.text import PP_ALIGN
+import copy
+import mmap
+from functools import lru_cache
+from itertools import islice
 
+# O python-pptx é importado sob demanda em _load_pptx, para que a CLI
+# (ex.: --help) não pague o custo da importação
+Presentation = Inches = Pt = RGBColor = PP_ALIGN = None
+
+# Cores fixas usadas nos slides (inicializadas em _load_pptx)
+_BLACK = _WHITE = _GRAY = _LIGHT_GRAY = None
+
+# Tamanhos de fonte usados nos slides (inicializados em _load_pptx)
+_PT44 = _PT40 = _PT36 = _PT32 = _PT28 = _PT24 = _PT20 = _PT16 = _PT14 = _PT12 = None
+
+# Itens do slide final
+_FINAL_SLIDE_ITEMS = (
+    "Recapitulação dos conceitos principais",
+    "Próximos passos: demonstração prática com scikit-learn e Airflow",
+    "Recursos para aprofundamento",
+    "Contato para dúvidas",
+)
+
+# Padrões de expressões regulares pré-compilados
+_HEADER_RE = re.compile(rb'^(#{1,2}) (.*?)\r?$', re.MULTILINE)
+_H1_RE = re.compile(rb'^# (.*?)\r?$', re.MULTILINE)
+_H3_RE = re.compile(r'^### (.*?)$', re.MULTILINE)
+_LIST_RE = re.compile(r'^[ \t]*[\*\-\+][ \t]+(.*)$', re.MULTILINE)
+_CODE_RE = re.compile(r'```(?:python)?\n(.*?)\n```', re.DOTALL)
+_QUOTE_RE = re.compile(r'^>\s*(.*)$', re.MULTILINE)
+_SUBTITLE_LINE_RE = re.compile(r'- Subtítulo: (.*?)$', re.MULTILINE)
+_DASH_ITEM_RE = re.compile(r'- (.*?)$', re.MULTILINE)
+
+# Número máximo de pontos de marcadores por slide
+_MAX_BULLETS = 5
+
+# Número máximo de linhas de código por slide
+_MAX_CODE_LINES = 8
+
+# Títulos de seções H2 que não entram na agenda
+_AGENDA_SKIP = frozenset({"Introdução", "Conclusão"})
+
+# Padrões sem retrocesso para a remoção de blocos de código e para os slides
+# do arquivo de estrutura: usam grupo atômico/quantificador possessivo com o
+# módulo regex quando disponível; com o módulo re padrão, as alternativas
+# mutuamente exclusivas e o corpo delimitado por lookahead já limitam o retrocesso
+try:
+    import regex as _re2
+    _CODE_FENCE_RE = _re2.compile(r'(?s)```(?>[^`]|`(?!``))*```')
+    _SLIDE_RE = _re2.compile(r'(?ms)^## Slide (\d+): ([^\n]*)\n?((?:(?!^## Slide \d+:).)*+)')
+except ImportError:
+    _CODE_FENCE_RE = re.compile(r'```(?:[^`]|`(?!``))*```')
+    _SLIDE_RE = re.compile(r'^## Slide (\d+): ([^\n]*)\n?((?:(?!^## Slide \d+:).)*)', re.MULTILINE | re.DOTALL)
+
+@lru_cache(maxsize=1)
+def _load_pptx():
+    """
+    Importa o python-pptx e inicializa as constantes que dependem dele.
+    """
+    global Presentation, Inches, Pt, RGBColor, PP_ALIGN
+    global _BLACK, _WHITE, _GRAY, _LIGHT_GRAY
+    global _PT44, _PT40, _PT36, _PT32, _PT28, _PT24, _PT20, _PT16, _PT14, _PT12
+    from pptx import Presentation
+    from pptx.util import Inches, Pt
+    from pptx.dml.color import RGBColor
+    from pptx.enum.text import PP_ALIGN
+    
+    _BLACK = RGBColor(0, 0, 0)
+    _WHITE = RGBColor(255, 255, 255)
+    _GRAY = RGBColor(128, 128, 128)
+    _LIGHT_GRAY = RGBColor(240, 240, 240)
+    
+    _PT44 = Pt(44)
+    _PT40 = Pt(40)
+    _PT36 = Pt(36)
+    _PT32 = Pt(32)
+    _PT28 = Pt(28)
+    _PT24 = Pt(24)
+    _PT20 = Pt(20)
+    _PT16 = Pt(16)
+    _PT14 = Pt(14)
+    _PT12 = Pt(12)
+
+@lru_cache(maxsize=32)
 def hex_to_rgb(hex_color):
     """Converte cor hexadecimal para RGB."""
+    _load_pptx()
     hex_color = hex_color.lstrip('#')
     return RGBColor(int(hex_color[0:2], 16), int(hex_color[2:4], 16), int(hex_color[4:6], 16))
 
@@ -22,27 +101,65 @@ def extract_sections_from_md(md_file):
     Extrai seções do arquivo Markdown baseado em cabeçalhos.
     Retorna uma lista de dicionários com título e conteúdo.
     """
-    with open(md_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
+    # Mapear o arquivo em memória em vez de carregá-lo inteiro; apenas os
+    # trechos usados nos slides são decodificados
+    with open(md_file, 'rb') as f:
+        try:
+            content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Arquivo vazio ou fonte sem suporte a mmap (ex.: stdin)
+            content = f.read()
+        try:
+            return _extract_sections(content)
+        finally:
+            if isinstance(content, mmap.mmap):
+                content.close()
+
+def _decode(data):
+    """
+    Decodifica um trecho do arquivo como UTF-8, normalizando quebras de linha.
+    """
+    text = data.decode('utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+def _extract_sections(content):
+    """
+    Monta as seções a partir do conteúdo bruto (bytes ou mmap) do arquivo Markdown.
+    """
     # Dividir o conteúdo por cabeçalhos de nível 1 e 2
     sections = []
     
+    # Percorrer os cabeçalhos H1 e H2 em uma única varredura,
+    # guardando apenas os deslocamentos de cada um no texto
+    main_title = None
+    h2_titles = []
+    h2_blocks = []  # (título, início do cabeçalho, início do corpo)
+    for match in _HEADER_RE.finditer(content):
+        level = len(match.group(1))
+        header_title = _decode(match.group(2))
+        if level == 1:
+            if main_title is None:
+                main_title = header_title
+        elif level == 2:
+            h2_titles.append(header_title)
+            h2_blocks.append((header_title, match.start(), match.end()))
+    
     # Encontrar o título principal (primeiro cabeçalho H1)
-    title_match = re.search(r'^# (.*?)$', content, re.MULTILINE)
-    main_title = title_match.group(1) if title_match else "Apresentação"
+    if main_title is None:
+        main_title = "Apresentação"
     
     # Encontrar o subtítulo (segundo cabeçalho H1 ou primeiro H2)
     subtitle = ""
-    if len(content.split('# ')) > 1:
-        subtitle_match = re.search(r'^# (.*?)$', content.split('# ')[1:][0], re.MULTILINE)
+    first_mark = content.find(b'# ')
+    if first_mark != -1:
+        subtitle_match = _H1_RE.search(content, first_mark + 2)
         if subtitle_match:
-            subtitle = subtitle_match.group(1)
+            subtitle = _decode(subtitle_match.group(1))
     
-    if not subtitle:
-        subtitle_match = re.search(r'^## (.*?)$', content, re.MULTILINE)
-        if subtitle_match:
-            subtitle = subtitle_match.group(1)
+    if not subtitle and h2_titles:
+        subtitle = h2_titles[0]
     
     # Adicionar slide de título
     sections.append({
@@ -51,128 +168,183 @@ def extract_sections_from_md(md_file):
         'subtitle': subtitle
     })
     
-    # Adicionar slide de agenda
+    # Adicionar slide de agenda (exceto introdução, conclusão e pré-requisitos)
     sections.append({
         'type': 'agenda',
         'title': 'Agenda',
-        'content': extract_agenda(content)
+        'content': [t for t in h2_titles if t not in _AGENDA_SKIP and "Pré-requisitos" not in t]
     })
     
-    # Extrair seções baseadas em cabeçalhos H2
-    h2_pattern = r'^## (.*?)$'
-    h2_titles = re.findall(h2_pattern, content, re.MULTILINE)
-    
-    h2_contents = re.split(h2_pattern, content, flags=re.MULTILINE)[1:]  # Primeiro item é o conteúdo antes do primeiro H2
-    
-    # Combinar títulos e conteúdos
-    for i in range(0, len(h2_titles)):
-        title = h2_titles[i]
+    # Combinar títulos e conteúdos: o corpo de cada H2 vai até o próximo H2
+    for i, (title, _, body_start) in enumerate(h2_blocks):
+        body_end = h2_blocks[i + 1][1] if i + 1 < len(h2_blocks) else len(content)
+        section_content = _decode(content[body_start:body_end])
         
-        # Obter conteúdo até o próximo H2
-        if i < len(h2_contents):
-            section_content = h2_contents[i]
-            
-            # Extrair subseções (H3)
-            subsections = extract_subsections(section_content)
-            
-            if subsections:
-                # Se houver subseções, criar um slide para cada uma
-                for subsection in subsections:
-                    sections.append({
-                        'type': 'content',
-                        'title': title + " - " + subsection['title'],
-                        'content': subsection['content']
-                    })
-            else:
-                # Se não houver subseções, criar um slide para a seção inteira
+        # Extrair subseções (H3)
+        subsections = extract_subsections(section_content)
+        
+        if subsections:
+            # Se houver subseções, criar um slide para cada uma
+            for subsection in subsections:
                 sections.append({
                     'type': 'content',
-                    'title': title,
-                    'content': section_content
+                    'title': title + " - " + subsection['title'],
+                    'content': subsection['content']
                 })
+        else:
+            # Se não houver subseções, criar um slide para a seção inteira
+            sections.append({
+                'type': 'content',
+                'title': title,
+                'content': section_content
+            })
     
     return sections
 
-def extract_agenda(content):
-    """
-    Extrai itens de agenda baseados em cabeçalhos H2.
-    """
-    h2_pattern = r'^## (.*?)$'
-    h2_titles = re.findall(h2_pattern, content, re.MULTILINE)
-    
-    agenda_items = []
-    for title in h2_titles:
-        if title != "Introdução" and title != "Conclusão" and "Pré-requisitos" not in title:
-            agenda_items.append(title)
-    
-    return agenda_items
-
 def extract_subsections(content):
     """
     Extrai subseções baseadas em cabeçalhos H3.
     """
-    h3_pattern = r'^### (.*?)$'
-    h3_titles = re.findall(h3_pattern, content, re.MULTILINE)
+    h3_matches = list(_H3_RE.finditer(content))
     
-    if not h3_titles:
+    if not h3_matches:
         return []
     
-    h3_contents = re.split(h3_pattern, content, flags=re.MULTILINE)[1:]  # Primeiro item é o conteúdo antes do primeiro H3
-    
     subsections = []
-    for i in range(0, len(h3_titles)):
-        title = h3_titles[i]
-        
-        # Obter conteúdo até o próximo H3
-        if i < len(h3_contents):
-            subsection_content = h3_contents[i]
-            subsections.append({
-                'title': title,
-                'content': subsection_content
-            })
+    for i, match in enumerate(h3_matches):
+        # Obter conteúdo até o próximo H3 (ou até o fim da seção)
+        body_end = h3_matches[i + 1].start() if i + 1 < len(h3_matches) else len(content)
+        subsections.append({
+            'title': match.group(1),
+            'content': content[match.end():body_end]
+        })
     
     return subsections
 
+def strip_code_blocks(content):
+    """
+    Remove blocos de código do conteúdo.
+    """
+    return _CODE_FENCE_RE.sub('', content)
+
 def extract_bullet_points(content):
     """
-    Extrai pontos de marcadores do conteúdo.
+    Gera os pontos de marcadores do conteúdo, sob demanda.
     """
     # Remover blocos de código
-    content = re.sub(r'```.*?```', '', content, flags=re.DOTALL)
+    content = strip_code_blocks(content)
     
     # Extrair listas não ordenadas
-    bullet_points = []
-    
-    # Padrão para listas com marcadores
-    list_pattern = r'^\s*[\*\-\+]\s+(.*?)$'
-    bullet_matches = re.findall(list_pattern, content, re.MULTILINE)
-    
-    if bullet_matches:
-        bullet_points.extend(bullet_matches)
+    found = False
+    for match in _LIST_RE.finditer(content):
+        found = True
+        yield match.group(1)
     
     # Se não houver marcadores explícitos, extrair parágrafos curtos
-    if not bullet_points:
-        paragraphs = [p.strip() for p in content.split('\n\n') if p.strip()]
-        bullet_points = [p for p in paragraphs if len(p) < 200 and not p.startswith('#')]
-    
-    return bullet_points
+    if not found:
+        yield from _short_paragraphs(content)
+
+def _short_paragraphs(content):
+    """
+    Gera os parágrafos curtos do conteúdo que não são cabeçalhos.
+    """
+    for chunk in content.split('\n\n'):
+        paragraph = chunk.strip()
+        if paragraph and len(paragraph) < 200 and not paragraph.startswith('#'):
+            yield paragraph
 
 def extract_code_blocks(content):
     """
     Extrai blocos de código do conteúdo.
     """
-    code_pattern = r'```(?:python)?\n(.*?)\n```'
-    code_blocks = re.findall(code_pattern, content, flags=re.DOTALL)
+    code_blocks = _CODE_RE.findall(content)
     return code_blocks
 
 def extract_quotes(content):
     """
     Extrai citações do conteúdo.
     """
-    quote_pattern = r'^>\s*(.*?)$'
-    quotes = re.findall(quote_pattern, content, re.MULTILINE)
+    quotes = _QUOTE_RE.findall(content)
     return quotes
 
+@lru_cache(maxsize=512)
+def _parse_section(content):
+    """
+    Extrai marcadores, citações e blocos de código de uma seção de uma só vez.
+    O resultado é memorizado pelo próprio texto da seção.
+    """
+    return (
+        tuple(islice(extract_bullet_points(content), _MAX_BULLETS)),  # Limitar a 5 pontos por slide
+        tuple(extract_quotes(content)),
+        tuple(extract_code_blocks(content))
+    )
+
+def _style_title(shape, text, size, color):
+    """
+    Define o texto de um título e aplica tamanho, cor e negrito.
+    """
+    shape.text = text
+    font = shape.text_frame.paragraphs[0].font
+    font.size = size
+    font.color.rgb = color
+    font.bold = True
+
+@lru_cache(maxsize=8)
+def _bullet_ppr(size, color, after):
+    """
+    Monta uma única vez o XML <a:pPr> (espaçamento, tamanho e cor) de um
+    estilo de marcador, para ser copiado em cada parágrafo.
+    """
+    from pptx.oxml import parse_xml
+    from pptx.oxml.ns import nsdecls
+    return parse_xml(
+        '<a:pPr %s><a:spcAft><a:spcPts val="%d"/></a:spcAft>'
+        '<a:defRPr sz="%d"><a:solidFill><a:srgbClr val="%s"/></a:solidFill></a:defRPr></a:pPr>'
+        % (nsdecls('a'), after.centipoints, size.centipoints, color)
+    )
+
+def _add_bullet(tf, text, size=None, color=None, after=None):
+    """
+    Adiciona um parágrafo de marcador formatado ao quadro de texto
+    (padrão: 28pt, preto, 12pt de espaçamento após o parágrafo).
+    """
+    ppr = _bullet_ppr(
+        size if size is not None else _PT28,
+        color if color is not None else _BLACK,
+        after if after is not None else _PT12
+    )
+    p = tf.add_paragraph()
+    p.text = text
+    p._p.insert(0, copy.deepcopy(ppr))
+
+def _build_code_box(slide):
+    """
+    Monta a caixa de texto dos blocos de código (posição, fonte e fundo cinza
+    claro) e a retorna como modelo XML, sem deixá-la no slide.
+    """
+    textbox = slide.shapes.add_textbox(Inches(1.0), Inches(4.0), Inches(11.33), Inches(2.5))
+    
+    p = textbox.text_frame.add_paragraph()
+    p.font.name = 'Courier New'
+    p.font.size = _PT16
+    
+    fill = textbox.fill
+    fill.solid()
+    fill.fore_color.rgb = _LIGHT_GRAY
+    
+    sp = textbox._element
+    sp.getparent().remove(sp)
+    return sp
+
+def _add_code_box(slide, template, code_text):
+    """
+    Adiciona ao slide uma cópia da caixa de código modelo com o texto informado.
+    """
+    sp = copy.deepcopy(template)
+    sp.nvSpPr.cNvPr.id = slide.shapes._next_shape_id
+    slide.shapes._spTree.insert_element_before(sp, 'p:extLst')
+    slide.shapes[-1].text_frame.paragraphs[-1].text = code_text
+
 def create_presentation(sections, output_file, main_color="#0097a7"):
     """
     Cria uma apresentação PowerPoint a partir das seções extraídas.
@@ -185,14 +357,11 @@ def create_presentation(sections, output_file, main_color="#0097a7"):
     Returns:
         Caminho para o arquivo de apresentação gerado
     """
+    _load_pptx()
     prs = Presentation()
     
     # Converter cor hexadecimal para RGB
     main_color_rgb = hex_to_rgb(main_color)
-    black = RGBColor(0, 0, 0)
-    white = RGBColor(255, 255, 255)
-    gray = RGBColor(128, 128, 128)
-    light_gray = RGBColor(240, 240, 240)
     
     # Definir tamanho dos slides (16:9)
     prs.slide_width = Inches(13.33)
@@ -203,27 +372,26 @@ def create_presentation(sections, output_file, main_color="#0097a7"):
     slide = prs.slides.add_slide(title_slide_layout)
     
     # Configurar título
-    title = slide.shapes.title
-    title.text = sections[0]['title']
-    title.text_frame.paragraphs[0].font.size = Pt(44)
-    title.text_frame.paragraphs[0].font.color.rgb = main_color_rgb
-    title.text_frame.paragraphs[0].font.bold = True
+    _style_title(slide.shapes.title, sections[0]['title'], _PT44, main_color_rgb)
     
     # Configurar subtítulo
     subtitle = slide.placeholders[1]
     subtitle.text = sections[0]['subtitle']
-    subtitle.text_frame.paragraphs[0].font.size = Pt(32)
-    subtitle.text_frame.paragraphs[0].font.color.rgb = black
+    subtitle.text_frame.paragraphs[0].font.size = _PT32
+    subtitle.text_frame.paragraphs[0].font.color.rgb = _BLACK
     
     # Adicionar rodapé com informações
     footer = slide.shapes.add_textbox(Inches(0.5), Inches(6.8), Inches(12.33), Inches(0.5))
     footer_text = footer.text_frame
     p = footer_text.paragraphs[0]
     p.text = "Disciplina de MLOps"
-    p.font.size = Pt(14)
-    p.font.color.rgb = gray
+    p.font.size = _PT14
+    p.font.color.rgb = _GRAY
     p.alignment = PP_ALIGN.RIGHT
     
+    # Modelo da caixa de texto dos blocos de código (criado no primeiro uso)
+    code_box = None
+    
     # Processar as demais seções
     for section in sections[1:]:
         if section['type'] == 'agenda':
@@ -232,11 +400,7 @@ def create_presentation(sections, output_file, main_color="#0097a7"):
             slide = prs.slides.add_slide(content_slide_layout)
             
             # Configurar título
-            title = slide.shapes.title
-            title.text = section['title']
-            title.text_frame.paragraphs[0].font.size = Pt(40)
-            title.text_frame.paragraphs[0].font.color.rgb = main_color_rgb
-            title.text_frame.paragraphs[0].font.bold = True
+            _style_title(slide.shapes.title, section['title'], _PT40, main_color_rgb)
             
             # Adicionar itens de agenda
             content = slide.placeholders[1]
@@ -244,11 +408,7 @@ def create_presentation(sections, output_file, main_color="#0097a7"):
             tf.clear()
             
             for item in section['content']:
-                p = tf.add_paragraph()
-                p.text = "• " + item
-                p.font.size = Pt(28)
-                p.font.color.rgb = black
-                p.space_after = Pt(12)
+                _add_bullet(tf, "• " + item)
         
         elif section['type'] == 'content':
             # Criar slide de conteúdo
@@ -256,20 +416,10 @@ def create_presentation(sections, output_file, main_color="#0097a7"):
             slide = prs.slides.add_slide(content_slide_layout)
             
             # Configurar título
-            title = slide.shapes.title
-            title.text = section['title']
-            title.text_frame.paragraphs[0].font.size = Pt(36)
-            title.text_frame.paragraphs[0].font.color.rgb = main_color_rgb
-            title.text_frame.paragraphs[0].font.bold = True
-            
-            # Extrair pontos de marcadores
-            bullet_points = extract_bullet_points(section['content'])
+            _style_title(slide.shapes.title, section['title'], _PT36, main_color_rgb)
             
-            # Extrair citações
-            quotes = extract_quotes(section['content'])
-            
-            # Extrair blocos de código
-            code_blocks = extract_code_blocks(section['content'])
+            # Extrair pontos de marcadores, citações e blocos de código
+            bullet_points, quotes, code_blocks = _parse_section(section['content'])
             
             # Adicionar conteúdo
             content = slide.placeholders[1]
@@ -281,82 +431,40 @@ def create_presentation(sections, output_file, main_color="#0097a7"):
                 p = tf.add_paragraph()
                 p.text = '"' + quotes[0] + '"'
                 p.font.italic = True
-                p.font.size = Pt(20)
-                p.font.color.rgb = gray
-                p.space_after = Pt(20)
+                p.font.size = _PT20
+                p.font.color.rgb = _GRAY
+                p.space_after = _PT20
             
             # Adicionar pontos de marcadores
-            for point in bullet_points[:5]:  # Limitar a 5 pontos por slide
-                p = tf.add_paragraph()
-                p.text = "• " + point
-                p.font.size = Pt(24)
-                p.font.color.rgb = black
-                p.space_after = Pt(12)
+            for point in bullet_points:
+                _add_bullet(tf, "• " + point, size=_PT24)
             
             # Adicionar bloco de código se houver
             if code_blocks:
-                # Adicionar caixa de texto para o código
-                left = Inches(1.0)
-                top = Inches(4.0)
-                width = Inches(11.33)
-                height = Inches(2.5)
-                
-                textbox = slide.shapes.add_textbox(left, top, width, height)
-                tf_code = textbox.text_frame
-                
                 # Limitar o código a algumas linhas para caber no slide
-                code_lines = code_blocks[0].split('\n')[:8]  # Máximo de 8 linhas
+                # (divide apenas o necessário, sem percorrer o bloco inteiro)
+                code_lines = code_blocks[0].split('\n', _MAX_CODE_LINES)[:_MAX_CODE_LINES]  # Máximo de 8 linhas
                 code_text = '\n'.join(code_lines)
                 
-                p = tf_code.add_paragraph()
-                p.text = code_text
-                p.font.name = 'Courier New'
-                p.font.size = Pt(16)
-                
-                # Adicionar fundo cinza claro para o código
-                fill = textbox.fill
-                fill.solid()
-                fill.fore_color.rgb = light_gray
+                # A caixa de código é montada uma única vez e clonada nos slides
+                if code_box is None:
+                    code_box = _build_code_box(slide)
+                _add_code_box(slide, code_box, code_text)
     
     # Adicionar slide final
     final_slide_layout = prs.slide_layouts[1]
     slide = prs.slides.add_slide(final_slide_layout)
     
     # Configurar título
-    title = slide.shapes.title
-    title.text = "Perguntas e Recursos Adicionais"
-    title.text_frame.paragraphs[0].font.size = Pt(40)
-    title.text_frame.paragraphs[0].font.color.rgb = main_color_rgb
-    title.text_frame.paragraphs[0].font.bold = True
+    _style_title(slide.shapes.title, "Perguntas e Recursos Adicionais", _PT40, main_color_rgb)
     
     # Adicionar conteúdo
     content = slide.placeholders[1]
     tf = content.text_frame
     tf.clear()
     
-    p = tf.add_paragraph()
-    p.text = "• Recapitulação dos conceitos principais"
-    p.font.size = Pt(28)
-    p.font.color.rgb = black
-    p.space_after = Pt(12)
-    
-    p = tf.add_paragraph()
-    p.text = "• Próximos passos: demonstração prática com scikit-learn e Airflow"
-    p.font.size = Pt(28)
-    p.font.color.rgb = black
-    p.space_after = Pt(12)
-    
-    p = tf.add_paragraph()
-    p.text = "• Recursos para aprofundamento"
-    p.font.size = Pt(28)
-    p.font.color.rgb = black
-    p.space_after = Pt(12)
-    
-    p = tf.add_paragraph()
-    p.text = "• Contato para dúvidas"
-    p.font.size = Pt(28)
-    p.font.color.rgb = black
-    p.space_after = Pt(12)
+    for item in _FINAL_SLIDE_ITEMS:
+        _add_bullet(tf, "• " + item)
     
     # Salvar apresentação
     prs.save(output_file)
@@ -381,19 +489,17 @@ def create_slides_from_structure(structure_file, output_file, main_color="#0097a
     # Extrair seções de slides
     slide_sections = []
     
-    # Padrão para encontrar definições de slides
-    slide_pattern = r'^## Slide (\d+): (.*?)$(.*?)(?=^## Slide \d+:|$)'
-    slide_matches = re.findall(slide_pattern, structure_content, re.MULTILINE | re.DOTALL)
+    # Encontrar todas as definições de slides em uma única varredura
+    slide_matches = list(_SLIDE_RE.finditer(structure_content))
     
     # Slide de título
-    title_match = re.search(r'## Slide 1: (.*?)$(.*?)(?=^## Slide \d+:|$)', structure_content, re.MULTILINE | re.DOTALL)
-    if title_match:
-        title = title_match.group(1).strip()
-        content = title_match.group(2).strip()
+    if len(slide_matches) > 0:
+        title = slide_matches[0].group(2).strip()
+        content = slide_matches[0].group(3).strip()
         
         # Extrair subtítulo
         subtitle = ""
-        subtitle_match = re.search(r'- Subtítulo: (.*?)$', content, re.MULTILINE)
+        subtitle_match = _SUBTITLE_LINE_RE.search(content)
         if subtitle_match:
             subtitle = subtitle_match.group(1).strip()
         
@@ -404,14 +510,13 @@ def create_slides_from_structure(structure_file, output_file, main_color="#0097a
         })
     
     # Slide de agenda
-    agenda_match = re.search(r'## Slide 2: (.*?)$(.*?)(?=^## Slide \d+:|$)', structure_content, re.MULTILINE | re.DOTALL)
-    if agenda_match:
-        title = agenda_match.group(1).strip()
-        content = agenda_match.group(2).strip()
+    if len(slide_matches) > 1:
+        title = slide_matches[1].group(2).strip()
+        content = slide_matches[1].group(3).strip()
         
         # Extrair itens de agenda
         agenda_items = []
-        items_match = re.findall(r'- (.*?)$', content, re.MULTILINE)
+        items_match = _DASH_ITEM_RE.findall(content)
         for item in items_match:
             if "Tópicos" not in item and "Imagem" not in item:
                 agenda_items.append(item)
@@ -423,16 +528,24 @@ def create_slides_from_structure(structure_file, output_file, main_color="#0097a
         })
     
     # Demais slides
-    for slide_num, title, content in slide_matches[2:]:  # Pular os dois primeiros slides (título e agenda)
+    for slide_match in slide_matches[2:]:  # Pular os dois primeiros slides (título e agenda)
         slide_sections.append({
             'type': 'content',
-            'title': title.strip(),
-            'content': content.strip()
+            'title': slide_match.group(2).strip(),
+            'content': slide_match.group(3).strip()
         })
     
     # Criar apresentação
     return create_presentation(slide_sections, output_file, main_color)
 
+def _default_output_file(input_file, output_dir=None):
+    """
+    Define o nome padrão do arquivo PowerPoint de saída a partir do arquivo de entrada.
+    """
+    base_name = os.path.splitext(os.path.basename(input_file))[0]
+    output_file = f"{base_name}_Slides.pptx"
+    return os.path.join(output_dir, output_file) if output_dir is not None else output_file
+
 def md_to_slides(md_file, output_file=None, main_color="#0097a7"):
     """
     Converte um arquivo Markdown em uma apresentação de slides.
@@ -451,8 +564,7 @@ def md_to_slides(md_file, output_file=None, main_color="#0097a7"):
     
     # Definir nome do arquivo de saída se não fornecido
     if output_file is None:
-        base_name = os.path.splitext(os.path.basename(md_file))[0]
-        output_file = f"{base_name}_Slides.pptx"
+        output_file = _default_output_file(md_file)
     
     # Extrair seções do arquivo Markdown
     print(f"Extraindo seções de: {md_file}")
@@ -480,15 +592,50 @@ def structure_to_slides(structure_file, output_file=None, main_color="#0097a7"):
     
     # Definir nome do arquivo de saída se não fornecido
     if output_file is None:
-        base_name = os.path.splitext(os.path.basename(structure_file))[0]
-        output_file = f"{base_name}_Slides.pptx"
+        output_file = _default_output_file(structure_file)
     
     # Criar apresentação a partir da estrutura
     print(f"Criando slides a partir da estrutura: {structure_file}")
     return create_slides_from_structure(structure_file, output_file, main_color)
 
+def batch(glob_pattern, output_dir=".", workers=None, main_color="#0097a7"):
+    """
+    Converte vários arquivos Markdown em apresentações de slides em paralelo.
+    
+    Args:
+        glob_pattern: Padrão glob dos arquivos Markdown de entrada (ex.: "aulas/*.md")
+        output_dir: Diretório dos arquivos PowerPoint de saída (padrão: diretório atual)
+        workers: Número de processos (padrão: número de CPUs)
+        main_color: Cor principal em formato hexadecimal (padrão: #0097a7)
+    
+    Returns:
+        Lista de caminhos para as apresentações geradas
+    """
+    import glob
+    from collections import Counter
+    from concurrent.futures import ProcessPoolExecutor
+    from itertools import repeat
+    
+    md_files = sorted(glob.glob(glob_pattern))
+    if not md_files:
+        raise FileNotFoundError(f"Nenhum arquivo encontrado para {glob_pattern}.")
+    
+    # Arquivos com o mesmo nome em diretórios diferentes gerariam a mesma saída
+    output_files = [_default_output_file(md_file, output_dir) for md_file in md_files]
+    duplicates = sorted(name for name, count in Counter(output_files).items() if count > 1)
+    if duplicates:
+        raise ValueError(f"Arquivos de entrada gerariam a mesma saída: {', '.join(duplicates)}")
+    
+    os.makedirs(output_dir, exist_ok=True)
+    
+    # Cada processo importa o python-pptx uma única vez e reutiliza para os seus arquivos
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(md_to_slides, md_files, output_files, repeat(main_color)))
+
 if __name__ == "__main__":
+    import fire
     fire.Fire({
         'md': md_to_slides,
-        'structure': structure_to_slides
+        'structure': structure_to_slides,
+        'batch': batch
     })
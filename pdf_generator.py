@@ -6,13 +6,284 @@ Cores personalizadas: preto e #0097a7 (azul-esverdeado)
 
 import os
 import re
-import markdown
-import fire
-from weasyprint import HTML, CSS
-from weasyprint.text.fonts import FontConfiguration
+from functools import lru_cache
 
-def md_to_html(md_content):
-    """Converte conteúdo Markdown para HTML."""
+# Padrões de expressões regulares pré-compilados
+_H1_RE = re.compile(r'^# (.*?)$', re.MULTILINE)
+_H2_RE = re.compile(r'^## (.*?)$', re.MULTILINE)
+
+# Folha de estilos do documento; a cor dos títulos é definida uma única vez
+# na propriedade --title-color e reutilizada com var()
+_CSS_TEMPLATE = """\
+:root {
+    --title-color: %(title_color)s;
+}
+
+@page {
+    size: A4;
+    margin: 2.5cm 2cm;
+    @top-right {
+        content: "%(title)s";
+        font-size: 9pt;
+        color: #666;
+    }
+    @bottom-center {
+        content: counter(page);
+        font-size: 9pt;
+    }
+}
+
+body {
+    font-family: "Noto Sans", "DejaVu Sans", sans-serif;
+    font-size: 11pt;
+    line-height: 1.4;
+    color: #333;
+}
+
+h1, h2, h3, h4, h5, h6 {
+    font-family: "Noto Sans", "DejaVu Sans", sans-serif;
+    color: var(--title-color);
+    margin-top: 1.5em;
+    margin-bottom: 0.5em;
+}
+
+h1 {
+    font-size: 24pt;
+    border-bottom: 2px solid var(--title-color);
+    padding-bottom: 0.2em;
+    page-break-before: always;
+}
+
+h1:first-of-type {
+    page-break-before: avoid;
+}
+
+h2 {
+    font-size: 18pt;
+    border-bottom: 1px solid var(--title-color);
+    padding-bottom: 0.1em;
+}
+
+h3 {
+    font-size: 14pt;
+}
+
+h4 {
+    font-size: 12pt;
+    font-style: italic;
+}
+
+p {
+    margin-bottom: 0.8em;
+    text-align: justify;
+}
+
+code {
+    font-family: "DejaVu Sans Mono", monospace;
+    background-color: #f5f5f5;
+    padding: 0.1em 0.3em;
+    border-radius: 3px;
+    font-size: 90%%;
+}
+
+pre {
+    background-color: #f5f5f5;
+    padding: 1em;
+    border-left: 4px solid var(--title-color);
+    overflow-x: auto;
+    margin: 1em 0;
+    border-radius: 3px;
+}
+
+pre code {
+    background-color: transparent;
+    padding: 0;
+    font-size: 90%%;
+}
+
+blockquote {
+    border-left: 4px solid var(--title-color);
+    padding-left: 1em;
+    margin-left: 0;
+    font-style: italic;
+    color: #555;
+}
+
+table {
+    border-collapse: collapse;
+    width: 100%%;
+    margin: 1em 0;
+}
+
+table, th, td {
+    border: 1px solid #ddd;
+}
+
+th {
+    background-color: var(--title-color);
+    color: white;
+    padding: 0.5em;
+    text-align: left;
+}
+
+td {
+    padding: 0.5em;
+}
+
+tr:nth-child(even) {
+    background-color: #f9f9f9;
+}
+
+img {
+    max-width: 100%%;
+    height: auto;
+}
+
+a {
+    color: var(--title-color);
+    text-decoration: none;
+}
+
+a:hover {
+    text-decoration: underline;
+}
+
+.cover {
+    height: 100vh;
+    display: flex;
+    flex-direction: column;
+    justify-content: center;
+    align-items: center;
+    text-align: center;
+    page-break-after: always;
+}
+
+.cover h1 {
+    font-size: 32pt;
+    border-bottom: none;
+    margin-bottom: 0.2em;
+}
+
+.cover h2 {
+    font-size: 20pt;
+    border-bottom: none;
+    font-weight: normal;
+    margin-top: 0;
+}
+
+.cover .author {
+    margin-top: 4em;
+    font-size: 14pt;
+}
+
+.toc {
+    page-break-after: always;
+}
+
+.toc h1 {
+    font-size: 24pt;
+    text-align: center;
+    border-bottom: none;
+}
+
+.toc ul {
+    list-style-type: none;
+    padding-left: 0;
+}
+
+.toc ul ul {
+    padding-left: 2em;
+}
+
+.toc a {
+    text-decoration: none;
+    color: #333;
+}
+
+.toc a::after {
+    content: leader('.') target-counter(attr(href), page);
+}
+
+.note {
+    background-color: #e8f4f5;
+    border-left: 4px solid var(--title-color);
+    padding: 1em;
+    margin: 1em 0;
+    border-radius: 3px;
+}
+
+.warning {
+    background-color: #fff8e6;
+    border-left: 4px solid #f0ad4e;
+    padding: 1em;
+    margin: 1em 0;
+    border-radius: 3px;
+}
+
+.tip {
+    background-color: #e6f5e6;
+    border-left: 4px solid #5cb85c;
+    padding: 1em;
+    margin: 1em 0;
+    border-radius: 3px;
+}
+
+.caption {
+    font-style: italic;
+    text-align: center;
+    color: #666;
+    margin-top: 0.5em;
+}
+
+.code-block code {
+    display: block;
+    white-space: pre-wrap;
+}
+"""
+
+# Estrutura do documento HTML (capa, sumário e conteúdo)
+_HTML_SHELL = """\
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>{title}</title>
+    <style>
+{css}    </style>
+</head>
+<body>
+    <div class="cover">
+        <h1>{title}</h1>
+        <h2>{subtitle}</h2>
+        <div class="author">{author}</div>
+    </div>
+    
+    <div class="toc">
+        <h1>Sumário</h1>
+        <!-- O sumário será gerado automaticamente pelo WeasyPrint -->
+    </div>
+    
+    {body}
+</body>
+</html>
+"""
+
+@lru_cache(maxsize=1)
+def _font_config():
+    """
+    Cria a configuração de fontes do WeasyPrint uma única vez por processo.
+    """
+    from weasyprint.text.fonts import FontConfiguration
+    return FontConfiguration()
+
+@lru_cache(maxsize=1)
+def _md_instance():
+    """
+    Cria o conversor Markdown uma única vez por processo, evitando reconstruir
+    o parser e suas extensões a cada arquivo.
+    """
+    import markdown
+    
     # Extensões para suportar tabelas, código, etc.
     extensions = [
         'markdown.extensions.tables',
@@ -22,14 +293,27 @@ def md_to_html(md_content):
         'markdown.extensions.smarty'
     ]
     
-    # Converter markdown para HTML
-    html_content = markdown.markdown(md_content, extensions=extensions)
-    
-    # Adicionar syntax highlighting para blocos de código
-    html_content = html_content.replace('<code>', '<code class="code-block">')
+    # Blocos de código recebem a classe code-block diretamente do codehilite
+    extension_configs = {
+        'markdown.extensions.codehilite': {'css_class': 'code-block'}
+    }
+    return markdown.Markdown(extensions=extensions, extension_configs=extension_configs)
+
+def md_to_html(md_content):
+    """Converte conteúdo Markdown para HTML."""
+    # Converter markdown para HTML (reset() limpa o estado da conversão anterior)
+    html_content = _md_instance().reset().convert(md_content)
     
     return html_content
 
+def _default_output_pdf(md_file, output_dir=None):
+    """
+    Define o nome padrão do arquivo PDF de saída a partir do arquivo Markdown.
+    """
+    base_name = os.path.splitext(os.path.basename(md_file))[0]
+    output_pdf = f"{base_name}_OReilly.pdf"
+    return os.path.join(output_dir, output_pdf) if output_dir is not None else output_pdf
+
 def create_oreilly_style_pdf(md_file, output_pdf=None, title_color="#0097a7", author="Material Didático para MLOps"):
     """
     Cria um PDF no estilo O'Reilly a partir de um arquivo Markdown.
@@ -49,282 +333,42 @@ def create_oreilly_style_pdf(md_file, output_pdf=None, title_color="#0097a7", au
     
     # Definir nome do arquivo de saída se não fornecido
     if output_pdf is None:
-        base_name = os.path.splitext(os.path.basename(md_file))[0]
-        output_pdf = f"{base_name}_OReilly.pdf"
+        output_pdf = _default_output_pdf(md_file)
     
     # Ler o conteúdo do arquivo Markdown
     with open(md_file, 'r', encoding='utf-8') as f:
         md_content = f.read()
     
     # Extrair título do documento (primeiro cabeçalho H1)
-    title_match = re.search(r'^# (.*?)$', md_content, re.MULTILINE)
+    title_match = _H1_RE.search(md_content)
     title = title_match.group(1) if title_match else "Documento sem título"
     
     # Extrair subtítulo (segundo cabeçalho H1 ou primeiro H2)
-    subtitle_match = re.search(r'^# (.*?)$', md_content.split('# ')[1:][0] if len(md_content.split('# ')) > 1 else "", re.MULTILINE)
+    _, sep, after = md_content.partition('# ')
+    after = after if sep else ""
+    subtitle_match = _H1_RE.search(after)
     if not subtitle_match:
-        subtitle_match = re.search(r'^## (.*?)$', md_content, re.MULTILINE)
+        subtitle_match = _H2_RE.search(md_content)
     subtitle = subtitle_match.group(1) if subtitle_match else ""
     
     # Converter Markdown para HTML
     html_content = md_to_html(md_content)
     
-    # Criar template HTML completo com estilos
-    html_template = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="UTF-8">
-        <title>{title}</title>
-        <style>
-            @page {{
-                size: A4;
-                margin: 2.5cm 2cm;
-                @top-right {{
-                    content: "{title}";
-                    font-size: 9pt;
-                    color: #666;
-                }}
-                @bottom-center {{
-                    content: counter(page);
-                    font-size: 9pt;
-                }}
-            }}
-            
-            body {{
-                font-family: "Noto Sans", "DejaVu Sans", sans-serif;
-                font-size: 11pt;
-                line-height: 1.4;
-                color: #333;
-            }}
-            
-            h1, h2, h3, h4, h5, h6 {{
-                font-family: "Noto Sans", "DejaVu Sans", sans-serif;
-                color: {title_color};
-                margin-top: 1.5em;
-                margin-bottom: 0.5em;
-            }}
-            
-            h1 {{
-                font-size: 24pt;
-                border-bottom: 2px solid {title_color};
-                padding-bottom: 0.2em;
-                page-break-before: always;
-            }}
-            
-            h1:first-of-type {{
-                page-break-before: avoid;
-            }}
-            
-            h2 {{
-                font-size: 18pt;
-                border-bottom: 1px solid {title_color};
-                padding-bottom: 0.1em;
-            }}
-            
-            h3 {{
-                font-size: 14pt;
-            }}
-            
-            h4 {{
-                font-size: 12pt;
-                font-style: italic;
-            }}
-            
-            p {{
-                margin-bottom: 0.8em;
-                text-align: justify;
-            }}
-            
-            code {{
-                font-family: "DejaVu Sans Mono", monospace;
-                background-color: #f5f5f5;
-                padding: 0.1em 0.3em;
-                border-radius: 3px;
-                font-size: 90%;
-            }}
-            
-            pre {{
-                background-color: #f5f5f5;
-                padding: 1em;
-                border-left: 4px solid {title_color};
-                overflow-x: auto;
-                margin: 1em 0;
-                border-radius: 3px;
-            }}
-            
-            pre code {{
-                background-color: transparent;
-                padding: 0;
-                font-size: 90%;
-            }}
-            
-            blockquote {{
-                border-left: 4px solid {title_color};
-                padding-left: 1em;
-                margin-left: 0;
-                font-style: italic;
-                color: #555;
-            }}
-            
-            table {{
-                border-collapse: collapse;
-                width: 100%;
-                margin: 1em 0;
-            }}
-            
-            table, th, td {{
-                border: 1px solid #ddd;
-            }}
-            
-            th {{
-                background-color: {title_color};
-                color: white;
-                padding: 0.5em;
-                text-align: left;
-            }}
-            
-            td {{
-                padding: 0.5em;
-            }}
-            
-            tr:nth-child(even) {{
-                background-color: #f9f9f9;
-            }}
-            
-            img {{
-                max-width: 100%;
-                height: auto;
-            }}
-            
-            a {{
-                color: {title_color};
-                text-decoration: none;
-            }}
-            
-            a:hover {{
-                text-decoration: underline;
-            }}
-            
-            .cover {{
-                height: 100vh;
-                display: flex;
-                flex-direction: column;
-                justify-content: center;
-                align-items: center;
-                text-align: center;
-                page-break-after: always;
-            }}
-            
-            .cover h1 {{
-                font-size: 32pt;
-                border-bottom: none;
-                margin-bottom: 0.2em;
-            }}
-            
-            .cover h2 {{
-                font-size: 20pt;
-                border-bottom: none;
-                font-weight: normal;
-                margin-top: 0;
-            }}
-            
-            .cover .author {{
-                margin-top: 4em;
-                font-size: 14pt;
-            }}
-            
-            .toc {{
-                page-break-after: always;
-            }}
-            
-            .toc h1 {{
-                font-size: 24pt;
-                text-align: center;
-                border-bottom: none;
-            }}
-            
-            .toc ul {{
-                list-style-type: none;
-                padding-left: 0;
-            }}
-            
-            .toc ul ul {{
-                padding-left: 2em;
-            }}
-            
-            .toc a {{
-                text-decoration: none;
-                color: #333;
-            }}
-            
-            .toc a::after {{
-                content: leader('.') target-counter(attr(href), page);
-            }}
-            
-            .note {{
-                background-color: #e8f4f5;
-                border-left: 4px solid {title_color};
-                padding: 1em;
-                margin: 1em 0;
-                border-radius: 3px;
-            }}
-            
-            .warning {{
-                background-color: #fff8e6;
-                border-left: 4px solid #f0ad4e;
-                padding: 1em;
-                margin: 1em 0;
-                border-radius: 3px;
-            }}
-            
-            .tip {{
-                background-color: #e6f5e6;
-                border-left: 4px solid #5cb85c;
-                padding: 1em;
-                margin: 1em 0;
-                border-radius: 3px;
-            }}
-            
-            .caption {{
-                font-style: italic;
-                text-align: center;
-                color: #666;
-                margin-top: 0.5em;
-            }}
-            
-            .code-block {{
-                display: block;
-                white-space: pre-wrap;
-            }}
-        </style>
-    </head>
-    <body>
-        <div class="cover">
-            <h1>{title}</h1>
-            <h2>{subtitle}</h2>
-            <div class="author">{author}</div>
-        </div>
-        
-        <div class="toc">
-            <h1>Sumário</h1>
-            <!-- O sumário será gerado automaticamente pelo WeasyPrint -->
-        </div>
-        
-        {html_content}
-    </body>
-    </html>
-    """
+    # Criar documento HTML completo com estilos
+    styles = _CSS_TEMPLATE % {'title_color': title_color, 'title': title}
+    html_template = _HTML_SHELL.format(title=title, subtitle=subtitle, author=author, css=styles, body=html_content)
+    
+    # O WeasyPrint (cairo/pango) é importado apenas quando um PDF é gerado
+    from weasyprint import HTML
     
-    # Configuração de fontes
-    font_config = FontConfiguration()
+    # Configuração de fontes (compartilhada entre os arquivos do processo)
+    font_config = _font_config()
     
-    # Criar HTML e CSS para o WeasyPrint
+    # Criar HTML para o WeasyPrint
     html = HTML(string=html_template)
-    css = CSS(string="", font_config=font_config)
     
     # Gerar o PDF
-    html.write_pdf(output_pdf, stylesheets=[css], font_config=font_config)
+    html.write_pdf(output_pdf, font_config=font_config)
     
     print(f"PDF gerado com sucesso: {output_pdf}")
     return output_pdf
@@ -344,5 +388,47 @@ def main(md_file, output_pdf=None, title_color="#0097a7", author="Material Didá
     """
     return create_oreilly_style_pdf(md_file, output_pdf, title_color, author)
 
+def batch(glob_pattern, output_dir=".", workers=None, title_color="#0097a7", author="Material Didático para MLOps"):
+    """
+    Gera PDFs no estilo O'Reilly para vários arquivos Markdown em paralelo.
+    
+    Args:
+        glob_pattern: Padrão glob dos arquivos Markdown de entrada (ex.: "aulas/*.md")
+        output_dir: Diretório dos arquivos PDF de saída (padrão: diretório atual)
+        workers: Número de processos (padrão: número de CPUs)
+        title_color: Cor dos títulos em formato hexadecimal (padrão: #0097a7)
+        author: Nome do autor ou identificação do material
+    
+    Returns:
+        Lista de caminhos para os PDFs gerados
+    """
+    import glob
+    from collections import Counter
+    from concurrent.futures import ProcessPoolExecutor
+    from itertools import repeat
+    
+    md_files = sorted(glob.glob(glob_pattern))
+    if not md_files:
+        raise FileNotFoundError(f"Nenhum arquivo encontrado para {glob_pattern}.")
+    
+    # Arquivos com o mesmo nome em diretórios diferentes gerariam a mesma saída
+    output_pdfs = [_default_output_pdf(md_file, output_dir) for md_file in md_files]
+    duplicates = sorted(name for name, count in Counter(output_pdfs).items() if count > 1)
+    if duplicates:
+        raise ValueError(f"Arquivos de entrada gerariam a mesma saída: {', '.join(duplicates)}")
+    
+    os.makedirs(output_dir, exist_ok=True)
+    
+    # Processos em vez de threads: o cairo não é seguro entre threads, e cada
+    # processo importa o WeasyPrint uma única vez para todos os seus arquivos
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(create_oreilly_style_pdf, md_files, output_pdfs, repeat(title_color), repeat(author)))
+
 if __name__ == "__main__":
-    fire.Fire(main)
+    import sys
+    import fire
+    # "batch" como primeiro argumento gera vários PDFs; caso contrário, um único arquivo
+    if len(sys.argv) > 1 and sys.argv[1] == 'batch':
+        fire.Fire(batch, command=sys.argv[2:])
+    else:
+        fire.Fire(main)